@@ -2,8 +2,9 @@
 
 use crate::error::CuriesError;
 use crate::fetch::{ExtendedPrefixMapSource, PrefixMapSource};
-use ptrie::Trie;
-use regex::Regex;
+use crate::pattern::IdPattern;
+use crate::trie::UriTrie;
+use rustc_hash::FxHashMap;
 use serde::{Deserialize, Serialize};
 use serde_json::Value;
 use std::collections::{HashMap, HashSet};
@@ -55,8 +56,8 @@ impl fmt::Display for Record {
 /// A `Converter` loads CURIEs `Records` (prefix, uri_prefix, synonyms, pattern),
 /// and enable to `compress` URIs or `expand` CURIEs.
 ///
-/// It is composed of 2 HashMaps (one for prefixes, one for URIs),
-/// and a trie search to find the longest URI
+/// It is composed of a HashMap for prefixes (using the fast Fx hash, since prefixes are short),
+/// and a radix trie to find the longest URI prefix of a URI
 ///
 /// # Examples
 ///
@@ -87,9 +88,17 @@ impl fmt::Display for Record {
 #[derive(Debug, Clone)]
 pub struct Converter {
     records: Vec<Arc<Record>>,
-    prefix_map: HashMap<String, Arc<Record>>,
-    trie: Trie<u8, Arc<Record>>,
+    // The lookup structures are behind an `Arc` so that cloning a converter (e.g. the cached ones
+    // of `sources`) shares them, they are only copied when a clone is modified
+    /// Classified pattern of each record in `records`, used to validate ids
+    patterns: Arc<Vec<Option<IdPattern>>>,
+    /// Index in `records` of the record of each prefix and synonym
+    prefix_map: Arc<FxHashMap<String, u32>>,
+    /// Index in `records` of the record of each URI prefix and synonym
+    trie: Arc<UriTrie<u32>>,
     delimiter: String,
+    /// The delimiter as a `char` when it is a single character, to split CURIEs with a fast byte search
+    delimiter_char: Option<char>,
 }
 
 impl Converter {
@@ -104,11 +113,15 @@ impl Converter {
     /// converter.add_record(record1).unwrap();
     /// ```
     pub fn new(delimiter: &str) -> Self {
+        let mut chars = delimiter.chars();
+        let delimiter_char = chars.next().filter(|_| chars.next().is_none());
         Converter {
             records: Vec::new(),
-            prefix_map: HashMap::new(),
-            trie: Trie::<u8, Arc<Record>>::new(),
+            patterns: Arc::default(),
+            prefix_map: Arc::default(),
+            trie: Arc::default(),
             delimiter: delimiter.to_string(),
+            delimiter_char,
         }
     }
 
@@ -134,6 +147,7 @@ impl Converter {
     pub async fn from_prefix_map<T: PrefixMapSource>(prefix_map: T) -> Result<Self, CuriesError> {
         let prefix_map: HashMap<String, Value> = prefix_map.fetch().await?;
         let mut converter = Converter::default();
+        converter.reserve(prefix_map.len());
         for (prefix, uri_prefix) in prefix_map {
             if let Value::String(uri_prefix_str) = uri_prefix {
                 converter.add_record(Record::new(&prefix, &uri_prefix_str))?;
@@ -193,21 +207,33 @@ impl Converter {
     ) -> Result<Self, CuriesError> {
         let records = prefix_map.fetch().await?;
         let mut converter = Converter::default();
+        converter.reserve(records.len());
         for record in records {
             converter.add_record(record)?;
         }
         Ok(converter)
     }
 
+    /// Reserve capacity for at least `additional` more records, to avoid growing the maps while loading
+    fn reserve(&mut self, additional: usize) {
+        self.records.reserve(additional);
+        Arc::make_mut(&mut self.patterns).reserve(additional);
+        Arc::make_mut(&mut self.prefix_map).reserve(additional);
+    }
+
     /// Add a `Record` to the `Converter`.
     /// When adding a new record we create a reference to the `Record` (Arc)
-    /// And we use this reference in the prefix and URI hashmaps
+    /// And we use its index in the records vector in the prefix hashmap and the URI trie
     pub fn add_record(&mut self, record: Record) -> Result<(), CuriesError> {
-        let rec = Arc::new(record);
+        self.add_shared_record(Arc::new(record))
+    }
+
+    /// Add a `Record` already behind an `Arc`, without copying it
+    fn add_shared_record(&mut self, rec: Arc<Record>) -> Result<(), CuriesError> {
         if self.prefix_map.contains_key(&rec.prefix) {
             return Err(CuriesError::DuplicateRecord(rec.prefix.clone()));
         }
-        if self.trie.contains_key(rec.uri_prefix.bytes()) {
+        if self.trie.contains_key(rec.uri_prefix.as_bytes()) {
             return Err(CuriesError::DuplicateRecord(rec.uri_prefix.clone()));
         }
         // Check if any of the synonyms are already present in the maps
@@ -217,19 +243,22 @@ impl Converter {
             }
         }
         for uri_prefix in &rec.uri_prefix_synonyms {
-            if self.trie.contains_key(uri_prefix.bytes()) {
+            if self.trie.contains_key(uri_prefix.as_bytes()) {
                 return Err(CuriesError::DuplicateRecord(uri_prefix.clone()));
             }
         }
+        let idx = self.records.len() as u32;
+        Arc::make_mut(&mut self.patterns).push(rec.pattern.as_deref().map(IdPattern::new));
         self.records.push(rec.clone());
-        self.prefix_map.insert(rec.prefix.clone(), rec.clone());
+        let prefix_map = Arc::make_mut(&mut self.prefix_map);
+        prefix_map.insert(rec.prefix.clone(), idx);
         for prefix in &rec.prefix_synonyms {
-            self.prefix_map.insert(prefix.clone(), rec.clone());
+            prefix_map.insert(prefix.clone(), idx);
         }
-        self.trie
-            .insert(rec.uri_prefix.clone().bytes(), rec.clone());
+        let trie = Arc::make_mut(&mut self.trie);
+        trie.insert(rec.uri_prefix.as_bytes(), idx);
         for uri_prefix in &rec.uri_prefix_synonyms {
-            self.trie.insert(uri_prefix.bytes(), rec.clone());
+            trie.insert(uri_prefix.as_bytes(), idx);
         }
         Ok(())
     }
@@ -262,41 +291,42 @@ impl Converter {
             ));
         }
         let mut base_converter = converters.remove(0);
+        base_converter.reserve(converters.iter().map(Converter::len).sum());
         for converter in converters {
-            for arc_record in converter.records {
-                let record = Arc::try_unwrap(arc_record).unwrap_or_else(|arc| (*arc).clone());
-                // Function to check if the record or its synonyms already exist in the base converter
-                let find_record = |r: &Record| -> Option<Arc<Record>> {
-                    base_converter
-                        .prefix_map
-                        .get(&r.prefix)
-                        .cloned()
-                        .or_else(|| {
-                            r.prefix_synonyms
-                                .iter()
-                                .find_map(|synonym| base_converter.prefix_map.get(synonym).cloned())
-                        })
-                };
-                if let Some(existing_arc) = find_record(&record) {
-                    if existing_arc.uri_prefix != record.uri_prefix {
+            // Records are shared with the chained converter instead of being copied, as they may
+            // also be held elsewhere, e.g. by the cached converters of `sources`
+            for record in converter.records {
+                // Check if the record or its synonyms already exist in the base converter
+                let existing_idx = base_converter
+                    .prefix_map
+                    .get(&record.prefix)
+                    .or_else(|| {
+                        record
+                            .prefix_synonyms
+                            .iter()
+                            .find_map(|synonym| base_converter.prefix_map.get(synonym))
+                    })
+                    .copied();
+                if let Some(idx) = existing_idx {
+                    let existing_record = &base_converter.records[idx as usize];
+                    if existing_record.uri_prefix != record.uri_prefix {
                         // Add the uri_prefix of the record as a synonym to the existing record
-                        let mut updated_record = Arc::try_unwrap(existing_arc.clone())
-                            .unwrap_or_else(|arc| (*arc).clone());
+                        let mut updated_record = (**existing_record).clone();
                         // Merge synonyms
                         updated_record
                             .uri_prefix_synonyms
                             .insert(record.uri_prefix.clone());
                         updated_record
                             .uri_prefix_synonyms
-                            .extend(record.uri_prefix_synonyms.clone());
+                            .extend(record.uri_prefix_synonyms.iter().cloned());
                         updated_record
                             .prefix_synonyms
-                            .extend(record.prefix_synonyms.clone());
+                            .extend(record.prefix_synonyms.iter().cloned());
                         base_converter.update_record(updated_record)?;
                     }
                 } else {
                     // If the prefix does not exist, add the record
-                    base_converter.add_record(record)?;
+                    base_converter.add_shared_record(record)?;
                 }
             }
         }
@@ -317,69 +347,71 @@ impl Converter {
     /// ```
     pub fn update_record(&mut self, record: Record) -> Result<(), CuriesError> {
         let rec = Arc::new(record);
-        // Update the record in the records vector
-        if let Some(pos) = self.records.iter().position(|r| r.prefix == rec.prefix) {
-            self.records[pos] = rec.clone();
-        } else {
+        // Find the record with the same main prefix, the prefix map gives its position directly
+        // unless this prefix was reassigned as a synonym of another record
+        let pos = self
+            .prefix_map
+            .get(&rec.prefix)
+            .map(|&idx| idx as usize)
+            .filter(|&idx| self.records[idx].prefix == rec.prefix)
+            .or_else(|| self.records.iter().position(|r| r.prefix == rec.prefix));
+        let Some(pos) = pos else {
             return Err(CuriesError::NotFound(rec.prefix.clone()));
-        }
+        };
         // Update the maps and trie
-        self.prefix_map.insert(rec.prefix.clone(), rec.clone());
+        let idx = pos as u32;
+        let prefix_map = Arc::make_mut(&mut self.prefix_map);
+        prefix_map.insert(rec.prefix.clone(), idx);
         for prefix in &rec.prefix_synonyms {
-            self.prefix_map.insert(prefix.clone(), rec.clone());
-        }
-        if self
-            .trie
-            .set_value(rec.uri_prefix.bytes(), rec.clone())
-            .is_err()
-        {
-            self.trie.insert(rec.uri_prefix.bytes(), rec.clone());
+            prefix_map.insert(prefix.clone(), idx);
         }
+        let trie = Arc::make_mut(&mut self.trie);
+        trie.insert(rec.uri_prefix.as_bytes(), idx);
         for uri_prefix in &rec.uri_prefix_synonyms {
-            if self
-                .trie
-                .set_value(uri_prefix.bytes(), rec.clone())
-                .is_err()
-            {
-                self.trie.insert(uri_prefix.bytes(), rec.clone());
-            }
+            trie.insert(uri_prefix.as_bytes(), idx);
         }
+        // Update the record in the records vector
+        Arc::make_mut(&mut self.patterns)[pos] = rec.pattern.as_deref().map(IdPattern::new);
+        self.records[pos] = rec;
         Ok(())
     }
 
     /// Find corresponding CURIE `Record` given a prefix
     pub fn find_by_prefix(&self, prefix: &str) -> Result<&Arc<Record>, CuriesError> {
         match self.prefix_map.get(prefix) {
-            Some(record) => Ok(record),
+            Some(&idx) => Ok(&self.records[idx as usize]),
             None => Err(CuriesError::NotFound(prefix.to_string())),
         }
     }
 
     /// Find corresponding CURIE `Record` given a URI prefix
     pub fn find_by_uri_prefix(&self, uri_prefix: &str) -> Result<&Arc<Record>, CuriesError> {
-        match self.trie.get(uri_prefix.bytes()) {
-            Some(record) => Ok(record),
+        match self.trie.get(uri_prefix.as_bytes()) {
+            Some(&idx) => Ok(&self.records[idx as usize]),
             None => Err(CuriesError::NotFound(uri_prefix.to_string())),
         }
     }
 
     /// Find corresponding CURIE `Record` given a complete URI
     pub fn find_by_uri(&self, uri: &str) -> Result<&Arc<Record>, CuriesError> {
-        match self.trie.find_longest_prefix(uri.bytes()) {
-            Some(rec) => Ok(rec),
+        self.split_uri(uri).map(|(idx, _)| &self.records[idx])
+    }
+
+    /// Find the index of the `Record` of the longest URI prefix matching a URI, and the id following this URI prefix
+    fn split_uri<'a>(&self, uri: &'a str) -> Result<(usize, &'a str), CuriesError> {
+        match self.trie.find_longest_prefix(uri.as_bytes()) {
+            Some((len, &idx)) => Ok((idx as usize, &uri[len..])),
             None => Err(CuriesError::NotFound(uri.to_string())),
         }
     }
 
-    /// Validate an id against a `Record` regex pattern if it exists
-    fn validate_id(&self, id: &str, record: &Arc<Record>) -> Result<(), CuriesError> {
-        if let Some(pattern) = &record.pattern {
-            let regex = Regex::new(pattern).map_err(|_| {
-                CuriesError::InvalidFormat(format!("Invalid regex pattern {pattern}"))
-            })?;
-            if !regex.is_match(id) {
+    /// Validate an id against the pattern of the `Record` at the given index, if it has one
+    fn validate_id(&self, id: &str, idx: usize) -> Result<(), CuriesError> {
+        if let Some(pattern) = &self.patterns[idx] {
+            if !pattern.is_match(id)? {
                 return Err(CuriesError::InvalidFormat(format!(
-                    "ID {id} does not match the pattern {pattern}"
+                    "ID {id} does not match the pattern {}",
+                    pattern.as_str()
                 )));
             }
         }
@@ -388,52 +420,79 @@ impl Converter {
 
     /// Compresses a URI to a CURIE
     pub fn compress(&self, uri: &str) -> Result<String, CuriesError> {
-        let record = self.find_by_uri(uri)?;
-        // Check for main prefix, if not match check in synonyms
-        let id = uri
-            .strip_prefix(&record.uri_prefix)
-            .or_else(|| {
-                record
-                    .uri_prefix_synonyms
-                    .iter()
-                    .find_map(|synonym| uri.strip_prefix(synonym))
-            })
-            .ok_or_else(|| CuriesError::NotFound(uri.to_string()))?;
-        self.validate_id(id, record)?;
-        Ok(format!("{}{}{}", &record.prefix, self.delimiter, id))
+        let (prefix, id) = self.compress_to_pair(uri)?;
+        Ok([prefix, &self.delimiter, id].concat())
+    }
+
+    /// Compresses a URI to the prefix and local id of its CURIE, without building the CURIE string
+    ///
+    /// ```
+    /// use curies::Converter;
+    ///
+    /// let mut converter = Converter::default();
+    /// converter.add_curie("doid", "http://purl.obolibrary.org/obo/DOID_").unwrap();
+    /// let pair = converter.compress_to_pair("http://purl.obolibrary.org/obo/DOID_1234").unwrap();
+    /// assert_eq!(pair, ("doid", "1234"));
+    /// ```
+    pub fn compress_to_pair<'a>(&'a self, uri: &'a str) -> Result<(&'a str, &'a str), CuriesError> {
+        // The trie gives the length of the matched URI prefix or synonym, no need to strip them again
+        let (idx, id) = self.split_uri(uri)?;
+        self.validate_id(id, idx)?;
+        Ok((&self.records[idx].prefix, id))
     }
 
     /// Expands a CURIE to a URI
     pub fn expand(&self, curie: &str) -> Result<String, CuriesError> {
-        let parts: Vec<&str> = curie.split(&self.delimiter).collect();
-        if parts.len() != 2 {
-            return Err(CuriesError::InvalidCurie(curie.to_string()));
+        let (prefix, id) = self
+            .split_curie(curie)
+            .ok_or_else(|| CuriesError::InvalidCurie(curie.to_string()))?;
+        self.expand_pair(prefix, id)
+    }
+
+    /// Split a CURIE in its prefix and local id, without collecting the parts.
+    /// A CURIE must contain exactly one delimiter.
+    fn split_curie<'a>(&self, curie: &'a str) -> Option<(&'a str, &'a str)> {
+        match self.delimiter_char {
+            // Searching a char uses the word-at-a-time memchr of the standard library,
+            // instead of the generic substring search used for string delimiters
+            Some(delimiter) => curie
+                .split_once(delimiter)
+                .filter(|(_, id)| !id.contains(delimiter)),
+            None => curie
+                .split_once(self.delimiter.as_str())
+                .filter(|(_, id)| !id.contains(self.delimiter.as_str())),
         }
-        let (prefix, id) = (parts[0], parts[1]);
-        let record = self.find_by_prefix(prefix)?;
-        self.validate_id(id, record)?;
-        Ok(format!("{}{}", record.uri_prefix, id))
     }
 
-    /// Compresses a list of URIs to CURIEs
+    /// Expands the prefix and local id of a CURIE to a URI, without having to split a CURIE string
+    ///
+    /// ```
+    /// use curies::Converter;
+    ///
+    /// let mut converter = Converter::default();
+    /// converter.add_curie("doid", "http://purl.obolibrary.org/obo/DOID_").unwrap();
+    /// let uri = converter.expand_pair("doid", "1234").unwrap();
+    /// assert_eq!(uri, "http://purl.obolibrary.org/obo/DOID_1234");
+    /// ```
+    pub fn expand_pair(&self, prefix: &str, id: &str) -> Result<String, CuriesError> {
+        let idx = match self.prefix_map.get(prefix) {
+            Some(&idx) => idx as usize,
+            None => return Err(CuriesError::NotFound(prefix.to_string())),
+        };
+        self.validate_id(id, idx)?;
+        Ok([self.records[idx].uri_prefix.as_str(), id].concat())
+    }
+
+    /// Compresses a list of URIs to CURIEs.
+    /// With the `parallel` feature, large lists are compressed on multiple threads.
     pub fn compress_list(&self, uris: Vec<&str>) -> Vec<Option<String>> {
-        uris.into_iter()
-            .map(|uri| match self.compress(uri) {
-                Ok(curie) => Some(curie),
-                Err(_) => None,
-            })
-            .collect()
+        map_list(uris, |uri| self.compress(uri).ok())
     }
 
-    /// Expands a list of CURIESs to URIs
+    /// Expands a list of CURIESs to URIs.
+    /// With the `parallel` feature, large lists are expanded on multiple threads.
     pub fn expand_list(&self, curies: Vec<&str>) -> Vec<Option<String>> {
-        curies
-            .into_iter()
-            .map(|curie| match self.expand(curie) {
-                Ok(uri) => Some(uri),
-                Err(_) => None,
-            })
-            .collect()
+        map_list(curies, |curie| self.expand(curie).ok())
     }
 
     /// Returns the number of `Records` in the `Converter`
@@ -447,6 +506,31 @@ impl Converter {
     }
 }
 
+/// Minimum number of items in a list to convert it in parallel
+#[cfg(feature = "parallel")]
+const PARALLEL_MIN_LIST_LEN: usize = 1024;
+
+/// Minimum number of items converted by each parallel task
+#[cfg(feature = "parallel")]
+const PARALLEL_MIN_TASK_LEN: usize = 256;
+
+/// Convert each item of a list, in parallel when the `parallel` feature is enabled and the list is large enough
+fn map_list<F>(items: Vec<&str>, convert: F) -> Vec<Option<String>>
+where
+    F: Fn(&str) -> Option<String> + Send + Sync,
+{
+    #[cfg(feature = "parallel")]
+    if items.len() >= PARALLEL_MIN_LIST_LEN {
+        use rayon::prelude::*;
+        return items
+            .into_par_iter()
+            .with_min_len(PARALLEL_MIN_TASK_LEN)
+            .map(convert)
+            .collect();
+    }
+    items.into_iter().map(convert).collect()
+}
+
 /// Implement the `Default` trait since we have a constructor that does not need arguments
 impl Default for Converter {
     fn default() -> Self {
@@ -49,6 +49,12 @@ impl From<serde_json::Error> for CuriesError {
         CuriesError::SerdeJson(err.to_string())
     }
 }
+#[cfg(feature = "simd-json")]
+impl From<simd_json::Error> for CuriesError {
+    fn from(err: simd_json::Error) -> Self {
+        CuriesError::SerdeJson(err.to_string())
+    }
+}
 impl From<reqwest::Error> for CuriesError {
     fn from(err: reqwest::Error) -> Self {
         CuriesError::Reqwest(err.to_string())
@@ -1,10 +1,10 @@
 //! Traits and functions for fetching data from HTTP or file system
 
 use async_trait::async_trait;
+use serde::de::DeserializeOwned;
 use serde_json::Value;
+use std::borrow::Cow;
 use std::collections::HashMap;
-use std::fs::File;
-use std::io::Read;
 use std::path::Path;
 
 use crate::{CuriesError, Record};
@@ -17,13 +17,13 @@ pub trait PrefixMapSource: Send + Sync {
 #[async_trait(?Send)]
 impl PrefixMapSource for &str {
     async fn fetch(self) -> Result<HashMap<String, Value>, CuriesError> {
-        Ok(serde_json::from_str(&fetch_url(self).await?)?)
+        parse_json(fetch_url(self).await?)
     }
 }
 #[async_trait(?Send)]
 impl PrefixMapSource for &Path {
     async fn fetch(self) -> Result<HashMap<String, Value>, CuriesError> {
-        Ok(serde_json::from_str(&fetch_file(self).await?)?)
+        parse_json(fetch_file(self).await?)
     }
 }
 #[async_trait(?Send)]
@@ -56,38 +56,52 @@ impl ExtendedPrefixMapSource for Vec<Record> {
 #[async_trait(?Send)]
 impl ExtendedPrefixMapSource for &str {
     async fn fetch(self) -> Result<Vec<Record>, CuriesError> {
-        Ok(serde_json::from_str(&fetch_url(self).await?)?)
+        parse_json(fetch_url(self).await?)
     }
 }
 #[async_trait(?Send)]
 impl ExtendedPrefixMapSource for &Path {
     async fn fetch(self) -> Result<Vec<Record>, CuriesError> {
-        Ok(serde_json::from_str(&fetch_file(self).await?)?)
+        parse_json(fetch_file(self).await?)
     }
 }
 
-/// Given a string, fetch data as string if it is a URL, otherwise return the string
-async fn fetch_url(url: &str) -> Result<String, CuriesError> {
+/// Given a string, fetch data as bytes if it is a URL, otherwise return the string bytes.
+/// The JSON is parsed directly from these bytes, without decoding it to a `String` first.
+async fn fetch_url(url: &str) -> Result<Cow<'_, [u8]>, CuriesError> {
     if url.starts_with("https://") || url.starts_with("http://") || url.starts_with("ftp://") {
         // Get URL content with HTTP request
         let client = reqwest::Client::new();
-        Ok(client
-            .get(url)
-            .header(reqwest::header::ACCEPT, "application/json")
-            .send()
-            .await?
-            .text()
-            .await?)
+        Ok(Cow::Owned(Vec::from(
+            client
+                .get(url)
+                .header(reqwest::header::ACCEPT, "application/json")
+                .send()
+                .await?
+                .bytes()
+                .await?,
+        )))
     } else {
-        Ok(url.to_owned())
+        Ok(Cow::Borrowed(url.as_bytes()))
     }
 }
 
 /// Given a `Path` get the file content if it exists
-async fn fetch_file(path: &Path) -> Result<String, CuriesError> {
+async fn fetch_file(path: &Path) -> Result<Cow<'_, [u8]>, CuriesError> {
     // Read from a file path
-    let mut file = File::open(path)?;
-    let mut contents = String::new();
-    file.read_to_string(&mut contents)?;
-    Ok(contents)
+    Ok(Cow::Owned(std::fs::read(path)?))
+}
+
+/// Parse JSON bytes, with the SIMD-accelerated `simd-json` parser when the `simd-json` feature is enabled.
+/// `simd-json` parses in place, so borrowed data is copied to a mutable buffer first.
+fn parse_json<T: DeserializeOwned>(data: Cow<'_, [u8]>) -> Result<T, CuriesError> {
+    #[cfg(feature = "simd-json")]
+    {
+        let mut data = data.into_owned();
+        Ok(simd_json::serde::from_slice(&mut data)?)
+    }
+    #[cfg(not(feature = "simd-json"))]
+    {
+        Ok(serde_json::from_slice(&data)?)
+    }
 }
@@ -5,7 +5,9 @@
 pub mod api;
 pub mod error;
 pub mod fetch;
+mod pattern;
 pub mod sources;
+mod trie;
 
 pub use api::{Converter, Record};
 pub use error::CuriesError;
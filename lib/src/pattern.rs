@@ -0,0 +1,82 @@
+//! Validation of local ids against the regex pattern of a `Record`
+
+use crate::error::CuriesError;
+use regex::Regex;
+use std::sync::OnceLock;
+
+/// A `Record` pattern, classified when the record is added to a `Converter`.
+///
+/// Most patterns only accept a number of decimal digits (e.g. `^\d+$` or `^\d{7}$`),
+/// ASCII ids are checked against them without running a regex.
+/// Other patterns are compiled to a regex once, on their first use.
+#[derive(Debug, Clone)]
+pub struct IdPattern {
+    pattern: String,
+    /// Minimum and maximum number of digits, if the pattern only accepts decimal digits
+    digits: Option<(usize, usize)>,
+    regex: OnceLock<Result<Regex, regex::Error>>,
+}
+
+impl IdPattern {
+    pub fn new(pattern: &str) -> Self {
+        IdPattern {
+            pattern: pattern.to_string(),
+            digits: parse_digits_pattern(pattern),
+            regex: OnceLock::new(),
+        }
+    }
+
+    /// Check if an id matches the pattern, fails if the pattern is not a valid regex
+    pub fn is_match(&self, id: &str) -> Result<bool, CuriesError> {
+        if let Some((min, max)) = self.digits {
+            // `\d` also matches non-ASCII Unicode digits, those ids are left to the regex
+            if id.is_ascii() {
+                return Ok(
+                    (min..=max).contains(&id.len()) && id.bytes().all(|b| b.is_ascii_digit())
+                );
+            }
+        }
+        match self.regex.get_or_init(|| Regex::new(&self.pattern)) {
+            Ok(regex) => Ok(regex.is_match(id)),
+            Err(_) => Err(CuriesError::InvalidFormat(format!(
+                "Invalid regex pattern {}",
+                self.pattern
+            ))),
+        }
+    }
+
+    pub fn as_str(&self) -> &str {
+        &self.pattern
+    }
+}
+
+/// Get the minimum and maximum number of digits accepted by patterns such as
+/// `^\d+$`, `^\d*$`, `^\d{7}$`, `^\d{2,}$`, `^\d{2,5}$` or their `[0-9]` equivalents
+fn parse_digits_pattern(pattern: &str) -> Option<(usize, usize)> {
+    let inner = pattern.strip_prefix('^')?.strip_suffix('$')?;
+    let quantifier = inner
+        .strip_prefix("\\d")
+        .or_else(|| inner.strip_prefix("[0-9]"))?;
+    match quantifier {
+        "" => Some((1, 1)),
+        "+" => Some((1, usize::MAX)),
+        "*" => Some((0, usize::MAX)),
+        _ => {
+            let bounds = quantifier.strip_prefix('{')?.strip_suffix('}')?;
+            let (min, max) = match bounds.split_once(',') {
+                None => (parse_count(bounds)?, parse_count(bounds)?),
+                Some((min, "")) => (parse_count(min)?, usize::MAX),
+                Some((min, max)) => (parse_count(min)?, parse_count(max)?),
+            };
+            (min <= max).then_some((min, max))
+        }
+    }
+}
+
+/// Parse a repetition count of a regex, only made of ASCII digits
+fn parse_count(count: &str) -> Option<usize> {
+    if count.is_empty() || !count.bytes().all(|b| b.is_ascii_digit()) {
+        return None;
+    }
+    count.parse().ok()
+}
@@ -1,6 +1,27 @@
 //! Contains functions for getting pre-defined contexts
 
 use crate::{error::CuriesError, Converter};
+use std::future::Future;
+use std::sync::OnceLock;
+
+static OBO_CONVERTER: OnceLock<Converter> = OnceLock::new();
+static MONARCH_CONVERTER: OnceLock<Converter> = OnceLock::new();
+static GO_CONVERTER: OnceLock<Converter> = OnceLock::new();
+static BIOREGISTRY_CONVERTER: OnceLock<Converter> = OnceLock::new();
+
+/// Get a converter from its cache, or load it and cache it if it is the first call.
+/// The returned clone shares the records and lookup structures of the cached converter.
+/// Failed loads are not cached, so they are retried on the next call.
+async fn get_cached_converter(
+    cache: &'static OnceLock<Converter>,
+    load: impl Future<Output = Result<Converter, CuriesError>>,
+) -> Result<Converter, CuriesError> {
+    if let Some(converter) = cache.get() {
+        return Ok(converter.clone());
+    }
+    let converter = load.await?;
+    Ok(cache.get_or_init(|| converter).clone())
+}
 
 /// Get the latest [OBO Foundry context](http://purl.obolibrary.org/meta/obo_context.jsonld).
 ///
@@ -8,6 +29,8 @@ use crate::{error::CuriesError, Converter};
 /// It contains OBO Foundry preferred prefixes and OBO PURL expansions,
 /// but no synonyms.
 ///
+/// The converter is downloaded on the first call, the next calls return a cheap copy sharing its data.
+///
 /// # Examples
 ///
 /// ```rust
@@ -32,7 +55,11 @@ use crate::{error::CuriesError, Converter};
 /// assert!(unregistered_curie.is_err());
 /// ```
 pub async fn get_obo_converter() -> Result<Converter, CuriesError> {
-    Converter::from_jsonld("https://purl.obolibrary.org/meta/obo_context.jsonld").await
+    get_cached_converter(
+        &OBO_CONVERTER,
+        Converter::from_jsonld("https://purl.obolibrary.org/meta/obo_context.jsonld"),
+    )
+    .await
 }
 
 /// Get the Prefix Commons-maintained [Monarch Initiative
@@ -48,6 +75,8 @@ pub async fn get_obo_converter() -> Result<Converter, CuriesError> {
 /// - SwissProt and `http://identifiers.org/SwissProt:`
 /// - UniProtKB" and `http://identifiers.org/uniprot/`
 ///
+/// The converter is downloaded on the first call, the next calls return a cheap copy sharing its data.
+///
 /// # Examples
 ///
 /// ```rust
@@ -72,7 +101,7 @@ pub async fn get_obo_converter() -> Result<Converter, CuriesError> {
 /// assert!(unregistered_curie.is_err(), "AddGene is not registered in the Monarch context");
 /// ```
 pub async fn get_monarch_converter() -> Result<Converter, CuriesError> {
-    Converter::from_jsonld("https://raw.githubusercontent.com/prefixcommons/prefixcommons-py/master/prefixcommons/registry/monarch_context.jsonld").await
+    get_cached_converter(&MONARCH_CONVERTER, Converter::from_jsonld("https://raw.githubusercontent.com/prefixcommons/prefixcommons-py/master/prefixcommons/registry/monarch_context.jsonld")).await
 }
 
 /// Get the Prefix Commons-maintained [Gene Ontology (GO)
@@ -83,6 +112,8 @@ pub async fn get_monarch_converter() -> Result<Converter, CuriesError> {
 /// modeling the molecular functions, cellular components, and biological processes
 /// that genes take part in.
 ///
+/// The converter is downloaded on the first call, the next calls return a cheap copy sharing its data.
+///
 /// # Examples
 ///
 /// ```rust
@@ -107,11 +138,13 @@ pub async fn get_monarch_converter() -> Result<Converter, CuriesError> {
 /// assert!(unregistered_curie.is_err(), "DOID is not registered in the GO context");
 /// ```
 pub async fn get_go_converter() -> Result<Converter, CuriesError> {
-    Converter::from_jsonld("https://raw.githubusercontent.com/prefixcommons/prefixcommons-py/master/prefixcommons/registry/go_context.jsonld").await
+    get_cached_converter(&GO_CONVERTER, Converter::from_jsonld("https://raw.githubusercontent.com/prefixcommons/prefixcommons-py/master/prefixcommons/registry/go_context.jsonld")).await
 }
 
 /// Get the BioRegistry extended prefix map.
 ///
+/// The converter is downloaded on the first call, the next calls return a cheap copy sharing its data.
+///
 /// # Examples
 ///
 /// ```rust
@@ -127,5 +160,5 @@ pub async fn get_go_converter() -> Result<Converter, CuriesError> {
 /// assert_eq!(uri, "https://www.ncbi.nlm.nih.gov/gene/100010");
 /// ```
 pub async fn get_bioregistry_converter() -> Result<Converter, CuriesError> {
-    Converter::from_extended_prefix_map("https://raw.githubusercontent.com/biopragmatics/bioregistry/main/exports/contexts/bioregistry.epm.json").await
+    get_cached_converter(&BIOREGISTRY_CONVERTER, Converter::from_extended_prefix_map("https://raw.githubusercontent.com/biopragmatics/bioregistry/main/exports/contexts/bioregistry.epm.json")).await
 }
@@ -0,0 +1,149 @@
+//! Compressed prefix (radix) trie used to find the longest URI prefix of a URI
+
+/// Index of a node in the trie arena
+type NodeIdx = u32;
+
+/// A node of the trie: the position of the bytes of the edge leading to it in the edges arena,
+/// its children sorted by the first byte of their edge, and an optional value
+#[derive(Debug, Clone)]
+struct Node<T> {
+    edge_start: u32,
+    edge_len: u32,
+    children: Vec<(u8, NodeIdx)>,
+    value: Option<T>,
+}
+
+impl<T> Node<T> {
+    fn new(edge_start: usize, edge_len: usize, value: Option<T>) -> Self {
+        Node {
+            edge_start: edge_start as u32,
+            edge_len: edge_len as u32,
+            children: Vec::new(),
+            value,
+        }
+    }
+
+    /// Binary search the child whose edge starts with the given byte
+    fn find_child(&self, byte: u8) -> Result<usize, usize> {
+        self.children.binary_search_by_key(&byte, |&(b, _)| b)
+    }
+}
+
+/// A radix trie keyed on bytes. Chains of single-child nodes are compressed into one edge,
+/// so a lookup does one binary search and one slice comparison per branching point.
+/// URI prefixes sharing a common root, such as `http://purl.obolibrary.org/obo/`, sit below
+/// a single edge holding this root: it is compared once per lookup, and URIs outside of it
+/// are rejected without visiting the rest of the trie.
+///
+/// Nodes are stored in a single `Vec`, and the bytes of all edges in a single arena:
+/// nodes only hold the position of their edge, and splitting an edge does not copy it.
+/// Values are expected to be small, such as indices of records stored by the caller.
+#[derive(Debug, Clone)]
+pub struct UriTrie<T> {
+    nodes: Vec<Node<T>>,
+    edges: Vec<u8>,
+}
+
+impl<T> UriTrie<T> {
+    /// Create an empty trie, containing only its root node
+    pub fn new() -> Self {
+        UriTrie {
+            nodes: vec![Node::new(0, 0, None)],
+            edges: Vec::new(),
+        }
+    }
+
+    /// Insert a value for the given key, returns the previous value if the key was already present
+    pub fn insert(&mut self, key: &[u8], value: T) -> Option<T> {
+        let mut node = 0;
+        let mut rest = key;
+        loop {
+            let Some(&byte) = rest.first() else {
+                return self.nodes[node].value.replace(value);
+            };
+            let pos = match self.nodes[node].find_child(byte) {
+                Ok(pos) => pos,
+                Err(pos) => {
+                    let edge_start = self.edges.len();
+                    self.edges.extend_from_slice(rest);
+                    let leaf = self.push(Node::new(edge_start, rest.len(), Some(value)));
+                    self.nodes[node].children.insert(pos, (byte, leaf));
+                    return None;
+                }
+            };
+            let mut child = self.nodes[node].children[pos].1 as usize;
+            let edge = self.edge(&self.nodes[child]);
+            let common = edge.iter().zip(rest).take_while(|(a, b)| a == b).count();
+            if common < edge.len() {
+                // The key diverges in the middle of the edge: split it with an intermediate node
+                let tail_byte = edge[common];
+                let head_start = self.nodes[child].edge_start as usize;
+                let mut mid = Node::new(head_start, common, None);
+                mid.children.push((tail_byte, child as NodeIdx));
+                self.nodes[child].edge_start += common as u32;
+                self.nodes[child].edge_len -= common as u32;
+                let mid = self.push(mid);
+                self.nodes[node].children[pos].1 = mid;
+                child = mid as usize;
+            }
+            node = child;
+            rest = &rest[common..];
+        }
+    }
+
+    /// Get the value stored for exactly this key
+    pub fn get(&self, key: &[u8]) -> Option<&T> {
+        let mut node = &self.nodes[0];
+        let mut rest = key;
+        while let Some(&byte) = rest.first() {
+            let pos = node.find_child(byte).ok()?;
+            node = &self.nodes[node.children[pos].1 as usize];
+            rest = rest.strip_prefix(self.edge(node))?;
+        }
+        node.value.as_ref()
+    }
+
+    /// Check if a value is stored for exactly this key
+    pub fn contains_key(&self, key: &[u8]) -> bool {
+        self.get(key).is_some()
+    }
+
+    /// Find the value of the longest key that is a prefix of the given bytes,
+    /// returns the length of this key alongside its value
+    pub fn find_longest_prefix(&self, key: &[u8]) -> Option<(usize, &T)> {
+        let mut node = &self.nodes[0];
+        let mut rest = key;
+        let mut longest = node.value.as_ref().map(|value| (0, value));
+        while let Some(&byte) = rest.first() {
+            let Ok(pos) = node.find_child(byte) else {
+                break;
+            };
+            node = &self.nodes[node.children[pos].1 as usize];
+            let Some(tail) = rest.strip_prefix(self.edge(node)) else {
+                break;
+            };
+            rest = tail;
+            if let Some(value) = &node.value {
+                longest = Some((key.len() - rest.len(), value));
+            }
+        }
+        longest
+    }
+
+    /// Get the bytes of the edge leading to a node
+    fn edge(&self, node: &Node<T>) -> &[u8] {
+        let start = node.edge_start as usize;
+        &self.edges[start..start + node.edge_len as usize]
+    }
+
+    fn push(&mut self, node: Node<T>) -> NodeIdx {
+        self.nodes.push(node);
+        (self.nodes.len() - 1) as NodeIdx
+    }
+}
+
+impl<T> Default for UriTrie<T> {
+    fn default() -> Self {
+        Self::new()
+    }
+}
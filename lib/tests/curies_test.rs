@@ -1,8 +1,12 @@
-use curies::{sources::get_bioregistry_converter, Converter, Record};
+use curies::{
+    sources::{get_bioregistry_converter, get_obo_converter},
+    Converter, Record,
+};
 use serde_json::Value;
 use std::{
     collections::{HashMap, HashSet},
     path::Path,
+    sync::Arc,
 };
 
 #[test]
@@ -104,6 +108,10 @@ fn new_empty_converter() -> Result<(), Box<dyn std::error::Error>> {
         .expand("wrong")
         .map_err(|e| assert!(e.to_string().starts_with("Invalid CURIE")))
         .is_err());
+    assert!(converter
+        .expand("doid:12:34")
+        .map_err(|e| assert!(e.to_string().starts_with("Invalid CURIE")))
+        .is_err());
     assert!(converter.find_by_uri_prefix("wrong").is_err());
     assert!(converter.expand("wrongpattern:1234").is_err());
     let record4 = Record {
@@ -188,6 +196,32 @@ async fn from_extended_map_file() -> Result<(), Box<dyn std::error::Error>> {
     Ok(())
 }
 
+#[cfg(feature = "simd-json")]
+#[tokio::test]
+async fn from_files_with_simd_json() -> Result<(), Box<dyn std::error::Error>> {
+    // Records parsed with simd-json should be the same as the ones parsed with serde_json
+    let path = Path::new("tests/resources/extended_map.json");
+    let records: Vec<Record> = serde_json::from_slice(&std::fs::read(path)?)?;
+    let converter = Converter::from_extended_prefix_map(path).await?;
+    assert_eq!(converter.len(), records.len());
+    for record in &records {
+        let loaded = converter.find_by_prefix(&record.prefix)?;
+        assert_eq!(loaded.uri_prefix, record.uri_prefix);
+        assert_eq!(loaded.prefix_synonyms, record.prefix_synonyms);
+        assert_eq!(loaded.uri_prefix_synonyms, record.uri_prefix_synonyms);
+        assert_eq!(loaded.pattern, record.pattern);
+    }
+    let path = Path::new("tests/resources/context.jsonld");
+    let context: Value = serde_json::from_slice(&std::fs::read(path)?)?;
+    let converter = Converter::from_jsonld(path).await?;
+    for (prefix, uri_prefix) in context["@context"].as_object().unwrap() {
+        if let Value::String(uri_prefix) = uri_prefix {
+            assert_eq!(&converter.find_by_prefix(prefix)?.uri_prefix, uri_prefix);
+        }
+    }
+    Ok(())
+}
+
 #[tokio::test]
 async fn from_extended_map_vec() -> Result<(), Box<dyn std::error::Error>> {
     let records: Vec<Record> = [
@@ -243,3 +277,224 @@ async fn chain_converters() -> Result<(), Box<dyn std::error::Error>> {
     // assert!(converter.delete_record("Wrong").is_err());
     Ok(())
 }
+
+#[tokio::test]
+async fn cached_converters() -> Result<(), Box<dyn std::error::Error>> {
+    let converter1 = get_obo_converter().await?;
+    let mut converter2 = get_obo_converter().await?;
+    // The converters returned by the next calls share the records of the cached converter
+    assert!(Arc::ptr_eq(
+        converter1.find_by_prefix("DOID")?,
+        converter2.find_by_prefix("DOID")?
+    ));
+    // Modifying a returned converter does not change the cached one
+    converter2.add_curie("notobo", "http://example.org/notobo/")?;
+    assert!(converter2.expand("notobo:1234").is_ok());
+    assert!(converter1.expand("notobo:1234").is_err());
+    assert!(get_obo_converter().await?.expand("notobo:1234").is_err());
+    Ok(())
+}
+
+#[test]
+fn longest_uri_prefix_match() -> Result<(), Box<dyn std::error::Error>> {
+    let mut converter = Converter::default();
+    converter.add_curie("obo", "http://purl.obolibrary.org/obo/")?;
+    converter.add_curie("doid", "http://purl.obolibrary.org/obo/DOID_")?;
+    converter.add_curie("go", "http://purl.obolibrary.org/obo/GO_")?;
+    converter.add_curie("purl", "http://purl.org/")?;
+    assert_eq!(
+        converter.compress("http://purl.obolibrary.org/obo/DOID_1234")?,
+        "doid:1234"
+    );
+    assert_eq!(
+        converter.compress("http://purl.obolibrary.org/obo/GO_1234")?,
+        "go:1234"
+    );
+    assert_eq!(
+        converter.compress("http://purl.obolibrary.org/obo/DO_1234")?,
+        "obo:DO_1234"
+    );
+    assert_eq!(converter.compress("http://purl.org/1234")?, "purl:1234");
+    assert!(converter
+        .compress("http://purl.obolibrary.org/1234")
+        .is_err());
+    assert!(converter.compress("http://purl").is_err());
+    assert!(converter
+        .find_by_uri_prefix("http://purl.obolibrary.org/")
+        .is_err());
+    Ok(())
+}
+
+#[test]
+fn compress_with_longest_uri_prefix_synonym() -> Result<(), Box<dyn std::error::Error>> {
+    let mut converter = Converter::default();
+    converter.add_record(Record {
+        prefix: "ex".to_string(),
+        uri_prefix: "http://example.org/".to_string(),
+        prefix_synonyms: HashSet::new(),
+        uri_prefix_synonyms: HashSet::from(["http://example.org/ex/".to_string()]),
+        pattern: None,
+    })?;
+    assert_eq!(converter.compress("http://example.org/1234")?, "ex:1234");
+    assert_eq!(converter.compress("http://example.org/ex/1234")?, "ex:1234");
+    Ok(())
+}
+
+#[test]
+fn chain_local_converters() -> Result<(), Box<dyn std::error::Error>> {
+    let mut converter1 = Converter::default();
+    converter1.add_curie("doid", "http://purl.obolibrary.org/obo/DOID_")?;
+    let mut converter2 = Converter::default();
+    converter2.add_record(Record {
+        prefix: "doid".to_string(),
+        uri_prefix: "https://identifiers.org/DOID/".to_string(),
+        prefix_synonyms: HashSet::from(["DOID".to_string()]),
+        uri_prefix_synonyms: HashSet::new(),
+        pattern: None,
+    })?;
+    converter2.add_curie("go", "http://purl.obolibrary.org/obo/GO_")?;
+    // Keep a copy, like the cached converters of `sources`, to check records are not copied
+    let cached = converter2.clone();
+    let converter = Converter::chain(vec![converter1, converter2])?;
+    assert_eq!(converter.len(), 2);
+    assert!(Arc::ptr_eq(
+        converter.find_by_prefix("go")?,
+        cached.find_by_prefix("go")?
+    ));
+    assert_eq!(
+        converter.compress("https://identifiers.org/DOID/1234")?,
+        "doid:1234"
+    );
+    assert_eq!(
+        converter.expand("DOID:1234")?,
+        "http://purl.obolibrary.org/obo/DOID_1234"
+    );
+    assert_eq!(
+        converter.find_by_prefix("DOID")?.uri_prefix,
+        "http://purl.obolibrary.org/obo/DOID_"
+    );
+    assert_eq!(
+        converter.compress("http://purl.obolibrary.org/obo/GO_1234")?,
+        "go:1234"
+    );
+    Ok(())
+}
+
+#[test]
+fn custom_delimiters() -> Result<(), Box<dyn std::error::Error>> {
+    for delimiter in ["/", "__"] {
+        let mut converter = Converter::new(delimiter);
+        converter.add_curie("doid", "http://purl.obolibrary.org/obo/DOID_")?;
+        let curie = format!("doid{delimiter}1234");
+        assert_eq!(
+            converter.compress("http://purl.obolibrary.org/obo/DOID_1234")?,
+            curie
+        );
+        assert_eq!(
+            converter.expand(&curie)?,
+            "http://purl.obolibrary.org/obo/DOID_1234"
+        );
+        assert!(converter.expand("doid:1234").is_err());
+        assert!(converter
+            .expand(&format!("doid{delimiter}12{delimiter}34"))
+            .is_err());
+    }
+    Ok(())
+}
+
+#[test]
+fn validate_id_patterns() -> Result<(), Box<dyn std::error::Error>> {
+    let mut converter = Converter::default();
+    for (prefix, pattern) in [
+        ("digits", "^\\d+$"),
+        ("seven", "^\\d{7}$"),
+        ("range", "^[0-9]{2,3}$"),
+        ("letters", "^[A-Z]+\\d*$"),
+    ] {
+        converter.add_record(Record {
+            prefix: prefix.to_string(),
+            uri_prefix: format!("http://example.org/{prefix}/"),
+            prefix_synonyms: HashSet::new(),
+            uri_prefix_synonyms: HashSet::new(),
+            pattern: Some(pattern.to_string()),
+        })?;
+    }
+    assert_eq!(
+        converter.expand("digits:0123")?,
+        "http://example.org/digits/0123"
+    );
+    assert!(converter.expand("digits:").is_err());
+    assert!(converter.expand("digits:12a").is_err());
+    assert!(converter.expand("digits:١٢٣").is_ok()); // `\d` matches Unicode digits
+    assert!(converter.expand("seven:1234567").is_ok());
+    assert!(converter.expand("seven:123456").is_err());
+    assert!(converter.expand("range:12").is_ok());
+    assert!(converter.expand("range:1234").is_err());
+    assert!(converter.expand("letters:ABC12").is_ok());
+    assert!(converter.expand("letters:abc").is_err());
+    assert_eq!(
+        converter.compress("http://example.org/seven/1234567")?,
+        "seven:1234567"
+    );
+    assert!(converter.compress("http://example.org/seven/12").is_err());
+    Ok(())
+}
+
+#[test]
+fn compress_with_common_uri_root() -> Result<(), Box<dyn std::error::Error>> {
+    let mut converter = Converter::default();
+    for prefix in ["DOID", "GO", "GOCHE", "OBI"] {
+        converter.add_curie(
+            &prefix.to_lowercase(),
+            &format!("http://purl.obolibrary.org/obo/{prefix}_"),
+        )?;
+    }
+    assert_eq!(
+        converter.compress("http://purl.obolibrary.org/obo/GO_1234")?,
+        "go:1234"
+    );
+    assert_eq!(
+        converter.compress("http://purl.obolibrary.org/obo/GOCHE_1234")?,
+        "goche:1234"
+    );
+    // Diverges inside the root shared by all URI prefixes
+    assert!(converter
+        .compress("http://purl.obolibrary.com/obo/GO_1234")
+        .is_err());
+    assert!(converter.compress("http://purl.obolibrary.org/").is_err());
+    assert!(converter
+        .compress("http://purl.obolibrary.org/obo/")
+        .is_err());
+    assert!(converter.compress("https://example.org/GO_1234").is_err());
+    Ok(())
+}
+
+#[test]
+fn convert_large_lists() -> Result<(), Box<dyn std::error::Error>> {
+    // Large enough to be converted in parallel with the `parallel` feature
+    let mut converter = Converter::default();
+    converter.add_curie("doid", "http://purl.obolibrary.org/obo/DOID_")?;
+    let uris: Vec<String> = (0..2000)
+        .map(|i| {
+            if i % 3 == 0 {
+                format!("http://wrong/{i}")
+            } else {
+                format!("http://purl.obolibrary.org/obo/DOID_{i}")
+            }
+        })
+        .collect();
+    let curies = converter.compress_list(uris.iter().map(String::as_str).collect());
+    let expected: Vec<Option<String>> = (0..2000)
+        .map(|i| (i % 3 != 0).then(|| format!("doid:{i}")))
+        .collect();
+    assert_eq!(curies, expected);
+    let expanded = converter.expand_list(curies.iter().flatten().map(String::as_str).collect());
+    let expected: Vec<Option<String>> = uris
+        .iter()
+        .enumerate()
+        .filter(|(i, _)| i % 3 != 0)
+        .map(|(_, uri)| Some(uri.clone()))
+        .collect();
+    assert_eq!(expanded, expected);
+    Ok(())
+}
@@ -1,5 +1,5 @@
-use ::curies::{Converter, Record};
-use pyo3::{exceptions::PyException, prelude::*};
+use ::curies::{Converter, CuriesError, Record};
+use pyo3::{exceptions::PyException, prelude::*, types::PyBytes};
 use pythonize::pythonize;
 use serde::{Deserialize, Serialize};
 use tokio::runtime::Runtime;
@@ -73,15 +73,18 @@ impl ConverterPy {
 
     #[staticmethod]
     #[pyo3(text_signature = "(data)")]
-    fn load_extended_prefix_map(data: &str) -> PyResult<Self> {
-        // Use a tokio runtime to wait on the async operation
-        let rt = Runtime::new().map_err(|e| {
-            PyErr::new::<PyException, _>(format!("Failed to create Tokio runtime: {e}"))
-        })?;
-        let result = rt.block_on(async move {
-            Converter::from_extended_prefix_map(data)
-                .await
-                .map_err(|e| PyErr::new::<PyException, _>(e.to_string()))
+    fn load_extended_prefix_map(py: Python<'_>, data: &str) -> PyResult<Self> {
+        // Release the GIL while the prefix map is fetched, parsed and the converter built
+        let result = py.allow_threads(move || {
+            // Use a tokio runtime to wait on the async operation
+            let rt = Runtime::new().map_err(|e| {
+                PyErr::new::<PyException, _>(format!("Failed to create Tokio runtime: {e}"))
+            })?;
+            rt.block_on(async move {
+                Converter::from_extended_prefix_map(data)
+                    .await
+                    .map_err(|e| PyErr::new::<PyException, _>(e.to_string()))
+            })
         });
         result.map(|converter| Self { converter })
     }
@@ -93,9 +96,133 @@ impl ConverterPy {
             .map_err(|e| PyErr::new::<PyException, _>(e.to_string()))
     }
 
-    fn compress(&self, uri: String) -> PyResult<String> {
+    fn compress(&self, uri: &str) -> PyResult<String> {
+        self.converter
+            .compress(uri)
+            .map_err(|e| PyErr::new::<PyException, _>(e.to_string()))
+    }
+
+    #[pyo3(text_signature = "($self, uri)")]
+    fn compress_to_pair(&self, py: Python<'_>, uri: &str) -> PyResult<PyObject> {
+        self.converter
+            .compress_to_pair(uri)
+            .map(|pair| pair.into_py(py))
+            .map_err(|e| PyErr::new::<PyException, _>(e.to_string()))
+    }
+
+    #[pyo3(text_signature = "($self, curie)")]
+    fn expand(&self, curie: &str) -> PyResult<String> {
         self.converter
-            .compress(&uri)
+            .expand(curie)
+            .map_err(|e| PyErr::new::<PyException, _>(e.to_string()))
+    }
+
+    #[pyo3(text_signature = "($self, prefix, id)")]
+    fn expand_pair(&self, prefix: &str, id: &str) -> PyResult<String> {
+        self.converter
+            .expand_pair(prefix, id)
+            .map_err(|e| PyErr::new::<PyException, _>(e.to_string()))
+    }
+
+    /// Compress a URI given as bytes to a CURIE returned as bytes, without decoding them to Python strings
+    #[pyo3(text_signature = "($self, uri)")]
+    fn compress_bytes(&self, py: Python<'_>, uri: &[u8]) -> PyResult<Py<PyBytes>> {
+        std::str::from_utf8(uri)
+            .map_err(CuriesError::from)
+            .and_then(|uri| self.converter.compress(uri))
+            .map(|curie| PyBytes::new(py, curie.as_bytes()).into())
+            .map_err(|e| PyErr::new::<PyException, _>(e.to_string()))
+    }
+
+    /// Expand a CURIE given as bytes to a URI returned as bytes, without decoding them to Python strings
+    #[pyo3(text_signature = "($self, curie)")]
+    fn expand_bytes(&self, py: Python<'_>, curie: &[u8]) -> PyResult<Py<PyBytes>> {
+        std::str::from_utf8(curie)
+            .map_err(CuriesError::from)
+            .and_then(|curie| self.converter.expand(curie))
+            .map(|uri| PyBytes::new(py, uri.as_bytes()).into())
             .map_err(|e| PyErr::new::<PyException, _>(e.to_string()))
     }
+
+    // The list methods borrow the Python strings and convert them without holding the GIL.
+    // No Python object can be created without the GIL (nor from the rayon threads of large lists),
+    // so the results are collected in a `Vec` and turned into a Python list once the GIL is held again.
+
+    /// Compress a list of URIs, `None` for the URIs that could not be compressed
+    #[pyo3(text_signature = "($self, uris)")]
+    fn compress_list(&self, py: Python<'_>, uris: Vec<&str>) -> Vec<Option<String>> {
+        py.allow_threads(move || self.converter.compress_list(uris))
+    }
+
+    /// Expand a list of CURIEs, `None` for the CURIEs that could not be expanded
+    #[pyo3(text_signature = "($self, curies)")]
+    fn expand_list(&self, py: Python<'_>, curies: Vec<&str>) -> Vec<Option<String>> {
+        py.allow_threads(move || self.converter.expand_list(curies))
+    }
+
+    /// Compress a batch of URIs concatenated in a single bytes buffer, item `i` being
+    /// `buf[offsets[i]:offsets[i + 1]]`, without holding the GIL. Returns the CURIEs packed the same way,
+    /// a URI that could not be compressed gives an empty slot.
+    /// Raises an exception for the whole batch if an item is not valid UTF-8 or the offsets are out of range.
+    #[pyo3(text_signature = "($self, buf, offsets)")]
+    fn compress_many_bytes(
+        &self,
+        py: Python<'_>,
+        buf: &[u8],
+        offsets: Vec<u32>,
+    ) -> PyResult<(Py<PyBytes>, Vec<u32>)> {
+        let (out, out_offsets) = py
+            .allow_threads(|| map_packed(buf, &offsets, |uri| self.converter.compress(uri).ok()))?;
+        Ok((PyBytes::new(py, &out).into(), out_offsets))
+    }
+
+    /// Expand a batch of CURIEs concatenated in a single bytes buffer, item `i` being
+    /// `buf[offsets[i]:offsets[i + 1]]`, without holding the GIL. Returns the URIs packed the same way,
+    /// a CURIE that could not be expanded gives an empty slot.
+    /// Raises an exception for the whole batch if an item is not valid UTF-8 or the offsets are out of range.
+    #[pyo3(text_signature = "($self, buf, offsets)")]
+    fn expand_many_bytes(
+        &self,
+        py: Python<'_>,
+        buf: &[u8],
+        offsets: Vec<u32>,
+    ) -> PyResult<(Py<PyBytes>, Vec<u32>)> {
+        let (out, out_offsets) = py.allow_threads(|| {
+            map_packed(buf, &offsets, |curie| self.converter.expand(curie).ok())
+        })?;
+        Ok((PyBytes::new(py, &out).into(), out_offsets))
+    }
+}
+
+/// Apply `convert` to each item of a packed batch (one buffer and the offsets delimiting its items),
+/// and pack the results in a new buffer with their offsets. Failed conversions give empty items,
+/// but an item that is not valid UTF-8 fails the whole batch.
+/// The returned offsets have the same length as the given offsets, so empty offsets give empty offsets.
+fn map_packed(
+    buf: &[u8],
+    offsets: &[u32],
+    convert: impl Fn(&str) -> Option<String>,
+) -> PyResult<(Vec<u8>, Vec<u32>)> {
+    let mut out: Vec<u8> = Vec::with_capacity(buf.len());
+    let mut out_offsets: Vec<u32> = Vec::with_capacity(offsets.len());
+    if offsets.is_empty() {
+        return Ok((out, out_offsets));
+    }
+    out_offsets.push(0);
+    for window in offsets.windows(2) {
+        let (start, end) = (window[0] as usize, window[1] as usize);
+        let item = buf.get(start..end).ok_or_else(|| {
+            PyErr::new::<PyException, _>(format!("Invalid offsets {start}..{end}"))
+        })?;
+        let item = std::str::from_utf8(item)
+            .map_err(CuriesError::from)
+            .map_err(|e| PyErr::new::<PyException, _>(e.to_string()))?;
+        if let Some(converted) = convert(item) {
+            out.extend_from_slice(converted.as_bytes());
+        }
+        let end = u32::try_from(out.len())
+            .map_err(|_| PyErr::new::<PyException, _>("Output buffer is too large"))?;
+        out_offsets.push(end);
+    }
+    Ok((out, out_offsets))
 }
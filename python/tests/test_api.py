@@ -1,4 +1,5 @@
 import unittest
+from itertools import accumulate
 
 from curies_rs import Record, Converter
 
@@ -15,3 +16,60 @@ class TestAPI(unittest.TestCase):
 
         uri = converter.compress("http://purl.obolibrary.org/obo/DOID_1234")
         self.assertEqual("doid:1234", uri)
+
+    def test_pairs(self):
+        """Test compressing to and expanding from prefix and id pairs."""
+        converter = Converter()
+        converter.add_record(Record("doid", "http://purl.obolibrary.org/obo/DOID_", [], []))
+
+        self.assertEqual("http://purl.obolibrary.org/obo/DOID_1234", converter.expand("doid:1234"))
+        self.assertEqual(("doid", "1234"), converter.compress_to_pair("http://purl.obolibrary.org/obo/DOID_1234"))
+        self.assertEqual("http://purl.obolibrary.org/obo/DOID_1234", converter.expand_pair("doid", "1234"))
+        with self.assertRaises(Exception):
+            converter.expand_pair("wrong", "1234")
+
+    def test_bytes(self):
+        """Test compressing and expanding bytes."""
+        converter = Converter()
+        converter.add_record(Record("doid", "http://purl.obolibrary.org/obo/DOID_", [], []))
+
+        self.assertEqual(b"doid:1234", converter.compress_bytes(b"http://purl.obolibrary.org/obo/DOID_1234"))
+        self.assertEqual(b"http://purl.obolibrary.org/obo/DOID_1234", converter.expand_bytes(b"doid:1234"))
+        with self.assertRaises(Exception):
+            converter.compress_bytes(b"http://wrong/1234")
+        # Invalid UTF-8 raises the UTF-8 decoding error
+        with self.assertRaisesRegex(Exception, "Error decoding UTF-8"):
+            converter.compress_bytes(b"\xff")
+        with self.assertRaisesRegex(Exception, "Error decoding UTF-8"):
+            converter.expand_bytes(b"\xff")
+
+    def test_lists(self):
+        """Test compressing and expanding lists."""
+        converter = Converter()
+        converter.add_record(Record("doid", "http://purl.obolibrary.org/obo/DOID_", [], []))
+
+        uris = [f"http://purl.obolibrary.org/obo/DOID_{i}" for i in range(2000)]
+        curies = converter.compress_list([*uris, "http://wrong/1234"])
+        self.assertEqual([*(f"doid:{i}" for i in range(2000)), None], curies)
+        self.assertEqual([*uris, None], converter.expand_list([*curies[:-1], "wrong:1234"]))
+
+    def test_many_bytes(self):
+        """Test compressing and expanding packed batches."""
+        converter = Converter()
+        converter.add_record(Record("doid", "http://purl.obolibrary.org/obo/DOID_", [], []))
+
+        uris = [b"http://purl.obolibrary.org/obo/DOID_1234", b"http://wrong/1234"]
+        buf, offsets = converter.compress_many_bytes(b"".join(uris), [0, *accumulate(len(uri) for uri in uris)])
+        self.assertEqual(b"doid:1234", buf)
+        self.assertEqual([0, 9, 9], offsets)
+
+        buf, offsets = converter.expand_many_bytes(buf, offsets)
+        self.assertEqual(b"http://purl.obolibrary.org/obo/DOID_1234", buf)
+        self.assertEqual([0, 40, 40], offsets)
+
+        # Offsets are returned with the same length as given ones
+        self.assertEqual((b"", []), converter.compress_many_bytes(b"", []))
+        self.assertEqual((b"", [0]), converter.compress_many_bytes(b"", [0]))
+        # An item that is not valid UTF-8 fails the whole batch
+        with self.assertRaises(Exception):
+            converter.compress_many_bytes(b"\xff" + uris[0], [0, 1, 1 + len(uris[0])])
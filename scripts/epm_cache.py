@@ -0,0 +1,39 @@
+"""Download a prefix map once and keep it in a local cache, shared by the benchmark scripts."""
+
+import hashlib
+import os
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "curies"
+MAX_AGE = 24 * 60 * 60
+TIMEOUT = 60
+
+
+def cached_download(url: str, max_age: float = MAX_AGE) -> Path:
+    """Return the path to a cached copy of the URL, only revalidated with its ETag when older than `max_age` seconds."""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    key = hashlib.sha256(url.encode()).hexdigest()
+    path = CACHE_DIR / f"{key}.json"
+    etag_path = CACHE_DIR / f"{key}.etag"
+    if path.exists() and time.time() - path.stat().st_mtime < max_age:
+        return path
+
+    request = urllib.request.Request(url, headers={"Accept": "application/json"})
+    if path.exists() and etag_path.exists():
+        request.add_header("If-None-Match", etag_path.read_text())
+    try:
+        with urllib.request.urlopen(request, timeout=TIMEOUT) as response:
+            # Write to a temporary file first, so an interrupted download does not leave a truncated cache
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            tmp_path.write_bytes(response.read())
+            tmp_path.replace(path)
+            if etag := response.headers.get("ETag"):
+                etag_path.write_text(etag)
+    except urllib.error.HTTPError as e:
+        if e.code != 304:
+            raise
+        path.touch()
+    return path